@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+import sys
+import time
 from dataclasses import dataclass, field
-from datetime import date
-from typing import Any
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable
 
+_today_cache: tuple[float, str] | None = None
 
-@dataclass
+
+def today_iso() -> str:
+    global _today_cache
+    if _today_cache is None or time.time() >= _today_cache[0]:
+        today = date.today()
+        next_midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        _today_cache = (next_midnight.timestamp(), today.isoformat())
+    return _today_cache[1]
+
+
+@dataclass(slots=True)
 class Vehicle:
     vehicle_id: str
     targa: str
@@ -14,7 +27,7 @@ class Vehicle:
     chilometraggio: int
     stato: str = "disponibile"
     note: str = ""
-    aggiornato_il: str = field(default_factory=lambda: date.today().isoformat())
+    aggiornato_il: str = field(default_factory=today_iso)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -29,14 +42,23 @@ class Vehicle:
         }
 
     @classmethod
-    def from_dict(cls, payload: dict[str, Any]) -> "Vehicle":
+    def from_dict(cls, payload: dict[str, Any], today: str | None = None) -> "Vehicle":
+        aggiornato_il = payload.get("aggiornato_il")
+        if aggiornato_il is None:
+            aggiornato_il = today or today_iso()
         return cls(
             vehicle_id=payload["vehicle_id"],
             targa=payload["targa"],
-            modello=payload["modello"],
+            modello=sys.intern(payload["modello"]),
             anno=int(payload["anno"]),
             chilometraggio=int(payload["chilometraggio"]),
-            stato=payload.get("stato", "disponibile"),
+            stato=sys.intern(payload.get("stato", "disponibile")),
             note=payload.get("note", ""),
-            aggiornato_il=payload.get("aggiornato_il", date.today().isoformat()),
+            aggiornato_il=aggiornato_il,
         )
+
+    @classmethod
+    def from_dicts(cls, payloads: Iterable[dict[str, Any]]) -> list["Vehicle"]:
+        today = today_iso()
+        from_dict = cls.from_dict
+        return [from_dict(item, today) for item in payloads]